@@ -1,7 +1,11 @@
 """Add "# pylint: disable" comments to silence the output of pylint."""
 
+import contextlib
+import io
 import os
 import shutil
+import time
+from collections.abc import Iterable
 
 VERSION = "1.4.2"
 
@@ -13,6 +17,9 @@ Commands:
       Remove pylint comments from specified python files.
   stats <python-file> ...
       Report statistics on number of pylint comments in specified files.
+  watch <path> ...
+      Keep pylint comments up to date while python files are being edited.
+      Changed files are reset, linted and silenced again.
 
 WARNING:
   Python files are modified in place.
@@ -21,6 +28,24 @@ WARNING:
 
 EOL = "\n"
 TEMP_FILE_ENDING = ".created_by_pylint_silent"
+# Arguments for running pylint in-process by 'watch'.
+# The message template is the one 'apply' knows how to parse.
+PYLINT_WATCH_ARGS = [
+    "--persistent=n",
+    # Files are about to be modified. Do not keep their parsed modules in memory.
+    "--clear-cache-post-run=y",
+    "--reports=n",
+    "--score=n",
+    "--msg-template={path}:{line}:{column}: {msg_id}: {msg} ({symbol})",
+]
+# 'watch' relies on pylint's --clear-cache-post-run option.
+WATCH_PYLINT_VERSION = (2, 17)
+WATCH_PYLINT_ERROR = (
+    "'watch' requires pylint >= 2.17 installed in the same environment"
+    " as pylint-silent."
+)
+# Folders that 'watch' does not search for python files, on top of hidden folders.
+WATCH_IGNORED_FOLDERS = {"__pycache__", "build", "dist", "node_modules", "venv"}
 
 
 def pyfile_add_comments(  # pylint: disable=too-many-locals; silent
@@ -95,67 +120,80 @@ def pyfile_add_comments(  # pylint: disable=too-many-locals; silent
 
 def apply(pylint_logfile: str, signature: str, max_line_length: int) -> None:
     """Process the output of pylint add disable comments for all messages."""
-    active_py_filename = None
-    messages: dict[int, set[str]] = {}
-
     with open(pylint_logfile, "r", encoding="utf-8") as logfile:
+        apply_lines(logfile, signature, max_line_length)
 
-        for line in logfile:
-            # 'line' should look like this:
-            # "test.py:35:10: W0613: Unused argument 'name' (unused-argument)"
-            line_parts = line.split(":", maxsplit=4)
-
-            if len(line_parts) != 5:
-                # Ignore lines with a different format.
-                continue
 
-            py_filename = line_parts[0]
-            line_no = int(line_parts[1])
-            # line_pos = line_parts[2]
-            code = line_parts[3]
-            message = line_parts[4]
+def apply_lines(
+    lines: Iterable[str], signature: str, max_line_length: int
+) -> dict[str, int]:
+    """Add disable comments for all messages in the lines of pylint output.
 
-            if code in {
-                    " R0401",  # Cyclic import
-                    " R0801",  # Similar lines in 2 files
-            }:
-                # Pylint reports the wrong file and line number for these messages.
+    Returns the number of messages silenced in each python file.
+    """
+    active_py_filename = None
+    messages: dict[int, set[str]] = {}
+    counts: dict[str, int] = {}
+
+    for line in lines:
+        # 'line' should look like this:
+        # "test.py:35:10: W0613: Unused argument 'name' (unused-argument)"
+        line_parts = line.split(":", maxsplit=4)
+
+        if len(line_parts) != 5:
+            # Ignore lines with a different format.
+            continue
+
+        py_filename = line_parts[0]
+        line_no = int(line_parts[1])
+        # line_pos = line_parts[2]
+        code = line_parts[3]
+        message = line_parts[4]
+
+        if code in {
+                " R0401",  # Cyclic import
+                " R0801",  # Similar lines in 2 files
+        }:
+            # Pylint reports the wrong file and line number for these messages.
+            continue
+        if code == " C0326":
+            # For C0326 the message symbol is shown on the next line.
+            # In pylint 2.6 bad-whitespace message was removed.
+            message_symbol = "bad-whitespace"  # pragma: no cover
+        else:
+            if message.find("(") < 0:  # pragma: no cover
+                print("Message missing message symbol:", message)
                 continue
-            if code == " C0326":
-                # For C0326 the message symbol is shown on the next line.
-                # In pylint 2.6 bad-whitespace message was removed.
-                message_symbol = "bad-whitespace"  # pragma: no cover
-            else:
-                if message.find("(") < 0:  # pragma: no cover
-                    print("Message missing message symbol:", message)
-                    continue
-                message_symbol = message[message.rfind("(") + 1:message.rfind(")")]
-                if message_symbol == "invalid-name" and "Module name" in message:
-                    # pylint reported a message of the form:
-                    # C0103: Module name "{}" doesn't conform to {} naming style
-                    # Give it a unique symbol since it requires special treatment.
-                    message_symbol = "invalid-MODULE-name"
-
-            if py_filename != active_py_filename:
-                # New file. Finish processing previous file.
-                if active_py_filename is not None:
-                    pyfile_add_comments(  # pragma: no cover
-                        active_py_filename, messages, signature, max_line_length
-                    )
-                active_py_filename = py_filename
-                messages = {}
-
-            if line_no in messages:
-                messages[line_no].add(message_symbol)
-            else:
-                # First message for this line_no
-                messages[line_no] = {message_symbol}
-
-        # Handle last file.
-        if active_py_filename is not None:
-            pyfile_add_comments(
-                active_py_filename, messages, signature, max_line_length
-            )
+            message_symbol = message[message.rfind("(") + 1:message.rfind(")")]
+            if message_symbol == "invalid-name" and "Module name" in message:
+                # pylint reported a message of the form:
+                # C0103: Module name "{}" doesn't conform to {} naming style
+                # Give it a unique symbol since it requires special treatment.
+                message_symbol = "invalid-MODULE-name"
+
+        if py_filename != active_py_filename:
+            # New file. Finish processing previous file.
+            if active_py_filename is not None:
+                pyfile_add_comments(
+                    active_py_filename, messages, signature, max_line_length
+                )
+            active_py_filename = py_filename
+            messages = {}
+
+        if line_no in messages:
+            messages[line_no].add(message_symbol)
+        else:
+            # First message for this line_no
+            messages[line_no] = {message_symbol}
+        counts[py_filename] = counts.get(py_filename, 0) + 1
+
+    # Handle last file.
+    if active_py_filename is not None:
+        pyfile_add_comments(
+            active_py_filename, messages, signature, max_line_length
+        )
+
+    return counts
 
 
 def reset(py_filename: str, signature: str) -> None:
@@ -253,3 +291,214 @@ def statistics(py_filenames: list[str], signature: str) -> None:
         print(f"{message}: {stats[message]}")
 
     print("TOTAL:", sum(stats.values()))
+
+
+def find_py_files(paths: list[str]) -> list[str]:
+    """List python files in 'paths', searching folders recursively.
+
+    Hidden folders, virtual environments and build folders are skipped.
+    """
+    py_filenames: list[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                # Prune in place, walking folders in a reproducible order.
+                dirnames[:] = sorted(
+                    dirname
+                    for dirname in dirnames
+                    if not dirname.startswith(".")
+                    and dirname not in WATCH_IGNORED_FOLDERS
+                    and not os.path.isfile(
+                        os.path.join(dirpath, dirname, "pyvenv.cfg")
+                    )
+                )
+                py_filenames.extend(
+                    os.path.join(dirpath, filename)
+                    for filename in sorted(filenames)
+                    if filename.endswith(".py")
+                )
+        elif path.endswith(".py"):
+            py_filenames.append(path)
+    return py_filenames
+
+
+def _mtimes(paths: list[str]) -> dict[str, int]:
+    """Return the modification time of every python file in 'paths'."""
+    mtimes = {}
+    for py_filename in find_py_files(paths):
+        # File may be removed while we are looking at it.
+        with contextlib.suppress(FileNotFoundError):
+            mtimes[py_filename] = os.stat(py_filename).st_mtime_ns
+    return mtimes
+
+
+def check_pylint() -> bool:
+    """Check that a pylint version supported by 'watch' is installed."""
+    try:
+        # pylint is only required for 'watch'.
+        # pylint: disable-next=import-outside-toplevel
+        from pylint.__pkginfo__ import numversion
+    except ImportError:
+        return False
+    return numversion >= WATCH_PYLINT_VERSION
+
+
+def _parse_failures(pylint_lines: list[str]) -> set[str]:
+    """Return absolute paths of files that pylint failed to parse."""
+    failed_paths = set()
+    for line in pylint_lines:
+        line_parts = line.split(":", maxsplit=4)
+        if len(line_parts) == 5 and (
+            line_parts[3] == " E0001"  # Syntax error
+            or line_parts[3].startswith(" F")  # Fatal error
+        ):
+            failed_paths.add(os.path.abspath(line_parts[0]))
+    return failed_paths
+
+
+def _restore(py_filename: str, content: bytes) -> bool:
+    """Write back the 'content' of a python file if it was changed."""
+    with open(py_filename, "rb") as py_file:
+        if py_file.read() == content:
+            return False
+    with open(py_filename, "wb") as py_file:
+        py_file.write(content)
+    return True
+
+
+def _restore_interrupted(
+    originals: dict[str, bytes], reset_mtimes: dict[str, int]
+) -> None:
+    """Restore files that were reset but not silenced again before an interrupt."""
+    for py_filename, content in originals.items():
+        # Remove leftovers of an interrupted reset or apply.
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(py_filename + TEMP_FILE_ENDING)
+        mtime = _mtimes([py_filename]).get(py_filename)
+        # Do not overwrite files that were silenced or saved by the user since.
+        if (
+            mtime is not None
+            and mtime == reset_mtimes.get(py_filename, mtime)
+            and _restore(py_filename, content)
+        ):
+            print(f"{py_filename}: restored")
+
+
+def _run_pylint(py_filenames: list[str]) -> list[str]:
+    """Run pylint in-process on python files and return its output lines."""
+    from pylint.lint import Run  # pylint: disable=import-outside-toplevel
+    from pylint.reporters.text import (  # pylint: disable=import-outside-toplevel
+        TextReporter,
+    )
+
+    output = io.StringIO()
+    Run([*PYLINT_WATCH_ARGS, *py_filenames], reporter=TextReporter(output), exit=False)
+    return output.getvalue().splitlines()
+
+
+def silence(
+    py_filenames: list[str], signature: str, max_line_length: int
+) -> tuple[dict[str, int], list[str]]:
+    """Reset, run pylint in-process and apply comments on python files.
+
+    Files modified while pylint was running are skipped, since the reported
+    line numbers do not match their content anymore. Files that pylint failed
+    to parse are probably still being edited. They are restored and skipped.
+    If interrupted, files that were not silenced yet are restored.
+
+    Returns the number of messages silenced in each python file and
+    the list of python files that pylint failed to parse.
+    """
+    originals: dict[str, bytes] = {}
+    reset_mtimes: dict[str, int] = {}
+    try:
+        for py_filename in py_filenames:
+            with open(py_filename, "rb") as py_file:
+                originals[py_filename] = py_file.read()
+            reset(py_filename, signature)
+            reset_mtimes.update(_mtimes([py_filename]))
+
+        pylint_lines = _run_pylint(py_filenames)
+
+        unmodified = [
+            py_filename
+            for py_filename, mtime in _mtimes(py_filenames).items()
+            if mtime == reset_mtimes[py_filename]
+        ]
+        failed_paths = _parse_failures(pylint_lines)
+        failed = [
+            py_filename
+            for py_filename in unmodified
+            if os.path.abspath(py_filename) in failed_paths
+        ]
+        for py_filename in failed:
+            _restore(py_filename, originals[py_filename])
+
+        # pylint reports paths relative to the current folder.
+        silenced_paths = {
+            os.path.abspath(py_filename) for py_filename in unmodified
+        } - failed_paths
+        counts = apply_lines(
+            (
+                line
+                for line in pylint_lines
+                if os.path.abspath(line.split(":", maxsplit=1)[0]) in silenced_paths
+            ),
+            signature,
+            max_line_length,
+        )
+    except KeyboardInterrupt:
+        _restore_interrupted(originals, reset_mtimes)
+        raise
+
+    abs_counts = {os.path.abspath(path): count for path, count in counts.items()}
+    return {
+        py_filename: abs_counts.get(os.path.abspath(py_filename), 0)
+        for py_filename in unmodified
+        if os.path.abspath(py_filename) in silenced_paths
+    }, failed
+
+
+def watch(
+    paths: list[str], signature: str, max_line_length: int, interval: float
+) -> None:
+    """Keep pylint comments up to date in python files that are being modified.
+
+    'paths' are polled every 'interval' seconds. Changed files are collected
+    until an interval passes without further changes. Then only these files
+    are silenced again. Results for unchanged files are kept in memory.
+    """
+    mtimes = _mtimes(paths)
+    counts: dict[str, int] = {}
+    changed: set[str] = set()
+
+    while True:
+        time.sleep(interval)
+        new_mtimes = _mtimes(paths)
+        for py_filename in mtimes.keys() - new_mtimes.keys():
+            counts.pop(py_filename, None)
+        new_changes = {
+            py_filename
+            for py_filename, mtime in new_mtimes.items()
+            if mtimes.get(py_filename) != mtime
+        }
+        mtimes = new_mtimes
+        changed = (changed | new_changes) & mtimes.keys()
+        if new_changes or not changed:
+            # Wait for the files to settle down.
+            continue
+
+        py_filenames = sorted(changed)
+        new_counts, failed = silence(py_filenames, signature, max_line_length)
+        counts.update(new_counts)
+        # Files modified while pylint was running need another round.
+        # Files that pylint failed to parse wait for the next save.
+        processed = [*new_counts, *failed]
+        changed -= set(processed)
+        # Do not treat our own modifications as changes.
+        mtimes.update(_mtimes(processed))
+
+        if new_counts:
+            for py_filename, count in new_counts.items():
+                print(f"{py_filename}: {count}")
+            print("TOTAL:", sum(counts.values()))
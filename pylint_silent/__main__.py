@@ -1,6 +1,8 @@
 """Main entry point for pylint-silent."""
 
 import argparse
+import contextlib
+import os
 import sys
 
 import pylint_silent
@@ -20,7 +22,7 @@ def main() -> int:
     parser.add_argument(
         "--version", action="version", version=f"pylint-silent {pylint_silent.VERSION}"
     )
-    parser.add_argument("command", choices=["apply", "reset", "stats"])
+    parser.add_argument("command", choices=["apply", "reset", "stats", "watch"])
     parser.add_argument("filename", nargs="+")
     parser.add_argument(
         "--signature",
@@ -38,6 +40,12 @@ def main() -> int:
             "on the preceding line instead to avoid longer lines. (Default: 999)"
         ),
     )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for modified files by 'watch'. (Default: 1.0)",
+    )
     args = parser.parse_args()
 
     signature = SIGNATURE if args.signature else ""
@@ -55,6 +63,19 @@ def main() -> int:
         pylint_silent.statistics(args.filename, signature)
         return 0
 
+    if args.command == "watch":
+        if not pylint_silent.check_pylint():
+            parser.error(pylint_silent.WATCH_PYLINT_ERROR)
+        for path in args.filename:
+            if not os.path.isdir(path) and not path.endswith(".py"):
+                parser.error(f"not a python file or folder: {path}")
+        # Keep watching until interrupted with Ctrl-C.
+        with contextlib.suppress(KeyboardInterrupt):
+            pylint_silent.watch(
+                args.filename, signature, args.max_line_length, args.interval
+            )
+        return 0
+
     return 1  # pragma: no cover
 
 
@@ -7,11 +7,13 @@ import runpy
 import shutil
 import unittest.mock
 from contextlib import redirect_stdout
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 import pylint.lint
 import pytest
 
+from pylint_silent import TEMP_FILE_ENDING, find_py_files
+
 
 def run_pylint_silent(*args: str) -> Union[int, str, None]:
     """Run pylint-silent as if it was an executable."""
@@ -217,3 +219,200 @@ def test_reset_sample2(ctx: Context) -> None:
     assert (
         filecmp.cmp(ctx.sample2_after_reset, ctx.temp_sample2_again_filename) is False
     )
+
+
+def touch(filename: str) -> None:
+    """Change the modification time of a file."""
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def run_watch(
+    tmpdir: str, sleep_actions: list[Callable[[], None]], *args: str
+) -> list[str]:
+    """Run 'pylint-silent watch' with a sleep doing 'sleep_actions' one by one.
+
+    pylint is configured like in test_apply(). Returns the lines printed by watch.
+    """
+    pylintrc = os.path.join(tmpdir, "pylintrc")
+    with open(pylintrc, "w", encoding="utf-8") as rc_file:
+        rc_file.write("[FORMAT]\nmax-module-lines=10\n")
+
+    def fake_sleep(_interval: float) -> None:
+        if not sleep_actions:
+            raise KeyboardInterrupt
+        sleep_actions.pop(0)()
+
+    watch_output = os.path.join(tmpdir, "watch_output")
+    with unittest.mock.patch("pylint_silent.time.sleep", fake_sleep), \
+         unittest.mock.patch.dict("os.environ", {"PYLINTRC": pylintrc}), \
+         open(watch_output, "w", encoding="utf-8") as out, \
+         redirect_stdout(out):
+        status = run_pylint_silent(
+            "watch", "--interval=0", "--max-line-length=70", *args
+        )
+    assert status == 0
+
+    with open(watch_output, "r", encoding="utf-8") as out:
+        return out.read().splitlines()
+
+
+def write_file(filename: str, content: str) -> None:
+    """Create a file, including its folder."""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "w", encoding="utf-8") as out:
+        out.write(content)
+
+
+def test_watch(ctx: Context, tmpdir: str) -> None:
+    """Test 'pylint-silent watch'.
+
+    Modified files should be silenced. Other files should not be touched.
+    """
+    venv_filename = os.path.join(tmpdir, "my_env", "module.py")
+    write_file(os.path.join(tmpdir, "my_env", "pyvenv.cfg"), "")
+    write_file(venv_filename, "import os\n")
+    hidden_venv_filename = os.path.join(tmpdir, ".venv", "lib", "module.py")
+
+    sleep_actions = [
+        lambda: touch(ctx.temp_sample_filename),
+        # Second change before the first one is handled.
+        lambda: touch(ctx.temp_sample2_filename),
+        lambda: write_file(hidden_venv_filename, "import os\n"),
+        lambda: None,  # Quiet interval, changed files are silenced.
+        lambda: None,  # Our own modifications are not changes.
+        lambda: os.remove(ctx.temp_sample2_filename),
+        lambda: touch(ctx.temp_sample_filename),
+        lambda: None,  # Quiet interval, silenced again.
+        lambda: None,
+    ]
+    lines = run_watch(str(tmpdir), sleep_actions, str(tmpdir))
+
+    assert lines == [
+        f"{ctx.temp_sample_filename}: 11",
+        f"{ctx.temp_sample2_filename}: 16",
+        "TOTAL: 27",
+        # The removed file is dropped from the total.
+        f"{ctx.temp_sample_filename}: 11",
+        "TOTAL: 11",
+    ]
+
+    assert_files_equal(ctx.temp_sample_filename, ctx.sample_after_apply)
+
+    # Unmodified files and virtual environments were not touched.
+    assert_files_equal(ctx.temp_sample2_again_filename, ctx.sample2_filename)
+    assert_files_equal(ctx.temp_sample_after_apply, ctx.sample_after_apply)
+    for filename in (venv_filename, hidden_venv_filename):
+        with open(filename, "r", encoding="utf-8") as py_file:
+            assert py_file.read() == "import os\n"
+
+    # Test that pylint is indeed silent now.
+    exitcode = ctx.run_pylint("--disable=duplicate-code")
+    assert exitcode == 0
+
+
+def test_watch_modified_during_pylint(ctx: Context, tmpdir: str) -> None:
+    """Test that 'pylint-silent watch' skips files saved while pylint runs."""
+    def save_during_first_run(*_args: object, **_kwargs: object) -> object:
+        if run_mock.call_count == 1:
+            touch(ctx.temp_sample_filename)
+        return unittest.mock.DEFAULT  # Continue to the real pylint run.
+
+    def assert_not_silenced() -> None:
+        assert_files_equal(ctx.temp_sample_filename, ctx.sample_filename)
+
+    sleep_actions = [
+        lambda: touch(ctx.temp_sample_filename),
+        lambda: None,  # Quiet interval, file is modified while pylint runs.
+        assert_not_silenced,  # File is changed again.
+        lambda: None,  # Quiet interval, file is silenced.
+        lambda: None,
+    ]
+    with unittest.mock.patch(
+        "pylint.lint.Run", wraps=pylint.lint.Run, side_effect=save_during_first_run
+    ) as run_mock:
+        lines = run_watch(str(tmpdir), sleep_actions, ctx.temp_sample_filename)
+
+    assert run_mock.call_count == 2
+    # Nothing is reported for the skipped run.
+    assert lines == [f"{ctx.temp_sample_filename}: 11", "TOTAL: 11"]
+    assert_files_equal(ctx.temp_sample_filename, ctx.sample_after_apply)
+
+
+def test_watch_syntax_error(tmpdir: str) -> None:
+    """Test that 'pylint-silent watch' leaves files with syntax errors as they are."""
+    py_filename = os.path.join(tmpdir, "module.py")
+    write_file(py_filename, '"""Module."""\n')
+    # No comments to remove from this one.
+    other_filename = os.path.join(tmpdir, "other.py")
+    write_file(other_filename, '"""Other module."""\n')
+    # Comments removed by the reset are restored.
+    syntax_error = '"""Module."""\nVAR = 1  # pylint: disable=invalid-name\ndef f(:\n'
+
+    def assert_syntax_error_kept() -> None:
+        with open(py_filename, "r", encoding="utf-8") as py_file:
+            assert py_file.read() == syntax_error
+        with open(other_filename, "r", encoding="utf-8") as py_file:
+            assert py_file.read() == "def g(:\n"
+
+    sleep_actions = [
+        lambda: write_file(py_filename, syntax_error),
+        lambda: write_file(other_filename, "def g(:\n"),
+        lambda: None,  # Quiet interval, pylint fails to parse the file.
+        assert_syntax_error_kept,
+        lambda: None,  # Not processed again before the next save.
+        lambda: write_file(py_filename, '"""Module."""\nimport os\n'),
+        lambda: None,  # Quiet interval, file is silenced.
+    ]
+    with unittest.mock.patch(
+        "pylint.lint.Run", wraps=pylint.lint.Run
+    ) as run_mock:
+        lines = run_watch(str(tmpdir), sleep_actions, py_filename, other_filename)
+
+    assert run_mock.call_count == 2
+    assert lines == [f"{py_filename}: 1", "TOTAL: 1"]
+    with open(py_filename, "r", encoding="utf-8") as py_file:
+        assert py_file.read() == (
+            '"""Module."""\nimport os  # pylint: disable=unused-import\n'
+        )
+
+
+def test_watch_interrupted(ctx: Context, tmpdir: str) -> None:
+    """Test that interrupting 'pylint-silent watch' restores reset files."""
+    temp_filename = ctx.temp_sample2_filename + TEMP_FILE_ENDING
+
+    def interrupt_apply(py_filename: str, *_args: object) -> None:
+        # Leave a temporary file behind like an interrupted apply.
+        shutil.copy(py_filename, temp_filename)
+        raise KeyboardInterrupt
+
+    sleep_actions = [
+        lambda: touch(ctx.temp_sample2_filename),
+        lambda: None,  # Quiet interval, interrupted while applying comments.
+    ]
+    with unittest.mock.patch("pylint_silent.pyfile_add_comments", interrupt_apply):
+        lines = run_watch(str(tmpdir), sleep_actions, ctx.temp_sample2_filename)
+
+    assert lines == [f"{ctx.temp_sample2_filename}: restored"]
+    assert_files_equal(ctx.temp_sample2_filename, ctx.sample2_filename)
+    assert not os.path.exists(temp_filename)
+
+
+def test_watch_pylint_version() -> None:
+    """Test 'pylint-silent watch' failure without a supported pylint."""
+    with unittest.mock.patch.dict("sys.modules", {"pylint.__pkginfo__": None}):
+        status = run_pylint_silent("watch", "tests")
+    assert status == 2
+
+    with unittest.mock.patch("pylint.__pkginfo__.numversion", (2, 16, 0)):
+        status = run_pylint_silent("watch", "tests")
+    assert status == 2
+
+
+def test_watch_not_python_file() -> None:
+    """Test 'pylint-silent watch' failure on a file that is not python code."""
+    status = run_pylint_silent("watch", "tests", "README.md")
+    assert status == 2
+
+    # Also ignored when calling the library directly.
+    assert find_py_files(["README.md", "tests/sample_2.py"]) == ["tests/sample_2.py"]